@@ -13,8 +13,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
+import sys
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from robot.errors import DataError
 from robot.model import SuiteNamePatterns
@@ -29,11 +31,19 @@ class SuiteStructure:
         self.source = source
         self.init_file = init_file
         self.children = children
+        self._extension: 'str|None' = None
 
     @property
     def extension(self) -> 'str|None':
-        source = self.source if self.is_file else self.init_file
-        return source.suffix[1:].lower() if source else None
+        # The extension is needed once per parsed structure, possibly several
+        # times. Computed lazily and interned so that parsers looking it up
+        # in a dict get fast pointer-equal keys.
+        if self._extension is None:
+            source = self.source if self.is_file else self.init_file
+            if source is None:
+                return None
+            self._extension = sys.intern(source.suffix[1:].lower())
+        return self._extension
 
     @property
     def is_file(self) -> bool:
@@ -52,6 +62,26 @@ class SuiteStructure:
         else:
             visitor.visit_directory(self)
 
+    def iter_events(self) -> 'Iterator[tuple[str, SuiteStructure]]':
+        """Yield ``(event, structure)`` tuples in :meth:`visit` order.
+
+        The event is ``'file'`` with files and ``'start_directory'`` or
+        ``'end_directory'`` around directory children. This is a flat
+        alternative to the visitor interface that avoids method dispatch
+        overhead with big structures.
+        """
+        stack = [('start_directory', self)]
+        while stack:
+            event, structure = stack.pop()
+            if structure.is_file:
+                yield 'file', structure
+            else:
+                yield event, structure
+                if event == 'start_directory':
+                    stack.append(('end_directory', structure))
+                    stack.extend(('start_directory', child)
+                                 for child in reversed(structure.children))
+
 
 class SuiteStructureVisitor:
 
@@ -105,16 +135,24 @@ class SuiteStructureBuilder:
         # If a directory is included, also its children are included.
         if self._is_suite_included(path.name, included_suites):
             included_suites = SuiteNamePatterns()
-        for item in self._list_dir(path):
-            if self._is_init_file(item):
+        for entry in self._list_dir(path):
+            if self._is_init_file_entry(entry):
                 if structure.init_file:
-                    LOGGER.error(f"Ignoring second test suite init file '{item}'.")
+                    LOGGER.error(f"Ignoring second test suite init file "
+                                 f"'{entry.path}'.")
                 else:
-                    structure.init_file = item
-            elif self._is_included(item, included_suites):
-                structure.add(self._build(item, included_suites))
+                    structure.init_file = Path(entry.path)
+            elif self._is_included_entry(entry, included_suites):
+                item = Path(entry.path)
+                if entry.is_dir():
+                    structure.add(self._build_directory(item, included_suites))
+                else:
+                    structure.add(SuiteStructure(item))
             else:
-                LOGGER.info(f"Ignoring file or directory '{item}'.")
+                # A callable message is formatted only if some logger
+                # actually consumes it.
+                LOGGER.info(lambda path=entry.path:
+                            f"Ignoring file or directory '{path}'.")
         return structure
 
     def _is_suite_included(self, name: str, included_suites: SuiteNamePatterns) -> bool:
@@ -124,9 +162,11 @@ class SuiteStructureBuilder:
             name = name.split('__', 1)[1] or name
         return included_suites.match(name)
 
-    def _list_dir(self, path: Path) -> 'list[Path]':
+    def _list_dir(self, path: Path) -> 'list[os.DirEntry]':
+        # `os.scandir` entries know their type without extra `stat` calls.
         try:
-            return sorted(path.iterdir(), key=lambda p: p.name.lower())
+            with os.scandir(path) as entries:
+                return sorted(entries, key=lambda entry: entry.name.lower())
         except OSError:
             raise DataError(f"Reading directory '{path}' failed: {get_error_message()}")
 
@@ -135,16 +175,26 @@ class SuiteStructureBuilder:
                 and path.suffix.lower() in self.extensions
                 and path.is_file())
 
-    def _is_included(self, path: Path, included_suites: SuiteNamePatterns) -> bool:
-        if path.name.startswith(self.ignored_prefixes):
+    def _is_init_file_entry(self, entry: os.DirEntry) -> bool:
+        stem, ext = os.path.splitext(entry.name)
+        return (stem.lower() == '__init__'
+                and ext.lower() in self.extensions
+                and entry.is_file())
+
+    def _is_included_entry(self, entry: os.DirEntry,
+                           included_suites: SuiteNamePatterns) -> bool:
+        if entry.name.startswith(self.ignored_prefixes):
             return False
-        if path.is_dir():
-            return path.name not in self.ignored_dirs
-        if not path.is_file():
+        if entry.is_dir():
+            return entry.name not in self.ignored_dirs
+        stem, ext = os.path.splitext(entry.name)
+        if ext.lower() not in self.extensions:
+            # Checked before the entry type to reject files that would not
+            # be parsed anyway without any file system calls.
             return False
-        if path.suffix.lower() not in self.extensions:
+        if not entry.is_file():
             return False
-        return self._is_suite_included(path.stem, included_suites)
+        return self._is_suite_included(stem, included_suites)
 
     def _build_multi_source(self, paths: Iterable[Path]) -> SuiteStructure:
         structure = SuiteStructure(children=[])
@@ -13,10 +13,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
 from itertools import chain
 from os.path import normpath
 from pathlib import Path
-from typing import Sequence
+from typing import Callable, Sequence
 
 from robot.conf import LanguagesLike
 from robot.errors import DataError
@@ -30,6 +34,96 @@ from .parsers import (CustomParser, JsonParser, NoInitFileDirectoryParser, Parse
 from .settings import TestDefaults
 
 
+_REST_EXTENSIONS = frozenset({'.rst', '.rest'})
+
+
+@lru_cache(maxsize=512)
+def _parse_suite_file_cached(source: str, mtime_ns: int, size: int,
+                             parser: Parser) -> TestSuite:
+    return parser.parse_suite_file(Path(source), TestDefaults())
+
+
+class _StandardParsers:
+    """Standard parsers mapped to extensions and created lazily on first use.
+
+    In the typical all ``.robot`` files case the parsers handling
+    reStructuredText and JSON data are never needed.
+    """
+    extensions = ('robot', 'rst', 'rest', 'rbt', 'json')
+
+    def __init__(self, lang: LanguagesLike, process_curdir: bool):
+        self._lang = lang
+        self._process_curdir = process_curdir
+        self._parsers: 'dict[str, Parser]' = {}
+
+    def __contains__(self, extension: str) -> bool:
+        return extension in self.extensions
+
+    def __getitem__(self, extension: str) -> Parser:
+        if extension not in self._parsers:
+            self._create(extension)
+        return self._parsers[extension]
+
+    def get(self, extension: str, default: 'Parser|None' = None) -> 'Parser|None':
+        return self[extension] if extension in self.extensions else default
+
+    def _create(self, extension: str):
+        parsers = self._parsers
+        if extension == 'robot':
+            parsers['robot'] = RobotParser(self._lang, self._process_curdir)
+        elif extension in ('rst', 'rest'):
+            parsers['rst'] = parsers['rest'] \
+                = RestParser(self._lang, self._process_curdir)
+        elif extension in ('rbt', 'json'):
+            parsers['rbt'] = parsers['json'] = JsonParser()
+        else:
+            raise KeyError(extension)
+
+
+def _get_standard_parsers(lang: LanguagesLike,
+                          process_curdir: bool) -> _StandardParsers:
+    # Parsers are stateless, so they can be shared by all builders using the
+    # same configuration. The returned mapping must not be modified.
+    try:
+        return _get_standard_parsers_cached(lang, process_curdir)
+    except TypeError:    # `lang` is not hashable.
+        return _StandardParsers(lang, process_curdir)
+
+
+@lru_cache(maxsize=32)
+def _get_standard_parsers_cached(lang: LanguagesLike,
+                                 process_curdir: bool) -> _StandardParsers:
+    return _StandardParsers(lang, process_curdir)
+
+
+@lru_cache(maxsize=64)
+def _import_custom_parser(name: 'str|Path', args: 'tuple[str, ...]') -> CustomParser:
+    # Cached because, for example, server and IDE like usages create builders,
+    # and thus import the same parsers, over and over again.
+    parser = Importer('parser', LOGGER).import_class_or_module(name, list(args))
+    try:
+        return CustomParser(parser)
+    except TypeError as err:
+        raise DataError(f"Importing parser '{name}' failed: {err}")
+
+
+def _parse_suite_file_in_process(source: str, extension: 'str|None',
+                                 lang: LanguagesLike, process_curdir: bool,
+                                 defaults: 'TestDefaults|None') -> TestSuite:
+    # Executed in a worker process when `workers > 1`. Only standard parsers
+    # are supported, because they can be recreated based on the extension.
+    parsers = _get_standard_parsers(lang, process_curdir)
+    parser = parsers.get(extension) or parsers['robot']
+    return parser.parse_suite_file(Path(source), defaults or TestDefaults())
+
+
+@lru_cache(maxsize=512)
+def _parse_resource_file_cached(source: str, mtime_ns: int, size: int,
+                                lang: LanguagesLike,
+                                process_curdir: bool) -> ResourceFile:
+    return ResourceFileBuilder(lang, process_curdir)._parse(Path(source))
+
+
 class TestSuiteBuilder:
     """Builder to construct ``TestSuite`` objects based on data on the disk.
 
@@ -58,7 +152,8 @@ class TestSuiteBuilder:
                  included_extensions: Sequence[str] = ('.robot', '.rbt'),
                  custom_parsers: Sequence[str] = (),
                  rpa: 'bool|None' = None, lang: LanguagesLike = None,
-                 allow_empty_suite: bool = False, process_curdir: bool = True):
+                 allow_empty_suite: bool = False, process_curdir: bool = True,
+                 enable_cache: bool = False, workers: int = 1):
         """
         :param include_suites:
             List of suite names to include. If not given, all suites are included.
@@ -84,42 +179,49 @@ class TestSuiteBuilder:
             Control processing the special ``${CURDIR}`` variable. It is
             resolved already at parsing time by default, but that can be
             changed by giving this argument ``False`` value.
+        :param enable_cache:
+            Cache parsed suite files based on their path, modification time
+            and size, and reuse the parsed data when the same file is built
+            again. Speeds up building the same data repeatedly, for example,
+            in long running processes. New in RF 6.1.
+        :param workers:
+            Maximum number of processes to use for parsing suite files in
+            parallel. Parsing is done in this process by default. Using
+            multiple workers can speed up building big suite structures
+            considerably, but only files parsed by the standard parsers are
+            parallelized. New in RF 6.1.
         """
-        self.standard_parsers = self._get_standard_parsers(lang, process_curdir)
+        self.standard_parsers = _get_standard_parsers(lang, process_curdir)
         self.custom_parsers = self._get_custom_parsers(custom_parsers)
         self.included_suites = tuple(included_suites or ())
         self.included_extensions = tuple(included_extensions or ())
         self.rpa = rpa
+        self.lang = lang
+        self.process_curdir = process_curdir
         self.allow_empty_suite = allow_empty_suite
-
-    def _get_standard_parsers(self, lang: LanguagesLike,
-                              process_curdir: bool) -> 'dict[str, Parser]':
-        robot_parser = RobotParser(lang, process_curdir)
-        rest_parser = RestParser(lang, process_curdir)
-        json_parser = JsonParser()
-        return {
-            'robot': robot_parser,
-            'rst': rest_parser,
-            'rest': rest_parser,
-            'rbt': json_parser,
-            'json': json_parser
-        }
+        self.enable_cache = enable_cache
+        self.workers = workers
+        self._base_parsers = self._get_base_parsers()
+        self._all_extensions = frozenset(
+            ext.lstrip('.').lower()
+            for ext in chain(self.included_extensions, self.custom_parsers)
+        )
+        self._is_file_cache: 'dict[Path, bool]' = {}
 
     def _get_custom_parsers(self, parsers: Sequence[str]) -> 'dict[str, CustomParser]':
         custom_parsers = {}
-        importer = Importer('parser', LOGGER)
         for parser in parsers:
             if isinstance(parser, (str, Path)):
                 name, args = split_args_from_name_or_path(parser)
-                parser = importer.import_class_or_module(name, args)
+                custom_parser = _import_custom_parser(name, tuple(args))
             else:
                 name = type_name(parser)
-            try:
-                custom_parser = CustomParser(parser)
-            except TypeError as err:
-                raise DataError(f"Importing parser '{name}' failed: {err}")
+                try:
+                    custom_parser = CustomParser(parser)
+                except TypeError as err:
+                    raise DataError(f"Importing parser '{name}' failed: {err}")
             for ext in custom_parser.extensions:
-                custom_parsers[ext] = custom_parser
+                custom_parsers[sys.intern(ext)] = custom_parser
         return custom_parsers
 
     def build(self, *paths: 'Path|str'):
@@ -128,11 +230,13 @@ class TestSuiteBuilder:
         :return: :class:`~robot.running.model.TestSuite` instance.
         """
         paths = self._normalize_paths(paths)
-        extensions = chain(self.included_extensions, self.custom_parsers)
-        structure = SuiteStructureBuilder(extensions,
+        structure = SuiteStructureBuilder(self._all_extensions,
                                           self.included_suites).build(*paths)
-        suite = SuiteStructureParser(self._get_parsers(paths),
-                                     self.rpa).parse(structure)
+        parser = SuiteStructureParser(self._get_parsers(paths), self.rpa,
+                                      enable_cache=self.enable_cache,
+                                      workers=self.workers, lang=self.lang,
+                                      process_curdir=self.process_curdir)
+        suite = parser.parse(structure)
         if not self.included_suites and not self.allow_empty_suite:
             self._validate_not_empty(suite, multi_source=len(paths) > 1)
         suite.remove_empty_suites(preserve_direct_children=len(paths) > 1)
@@ -144,89 +248,272 @@ class TestSuiteBuilder:
         # Cannot use `Path.resolve()` here because it resolves all symlinks which
         # isn't desired. `Path` doesn't have any methods for normalizing paths
         # so need to use `os.path.normpath()`. Also that _may_ resolve symlinks,
-        # but we need to do it for backwards compatibility.
-        paths = tuple(Path(normpath(p)).absolute() for p in paths)
-        non_existing = [p for p in paths if not p.exists()]
+        # but we need to do it for backwards compatibility. Joining with the
+        # current directory manually makes paths absolute with one `getcwd`
+        # call instead of `Path.absolute()` calling it for each path.
+        cwd = os.getcwd()
+        paths = tuple(Path(normpath(os.path.join(cwd, p))) for p in paths)
+        non_existing = self._get_non_existing(paths)
         if non_existing:
             raise DataError(f"Parsing {seq2str(non_existing)} failed: "
                             f"File or directory to execute does not exist.")
         return paths
 
-    def _get_parsers(self, paths: 'tuple[Path]'):
+    def _get_non_existing(self, paths: 'tuple[Path]') -> 'list[Path]':
+        # Check existence with one `os.scandir` per distinct parent directory
+        # instead of probing paths one by one. Especially on Windows checking
+        # each path separately is expensive. If a name is not found this way,
+        # fall back to `Path.exists()` that handles also, for example,
+        # case-insensitive file systems.
+        by_parent: 'dict[Path, list[Path]]' = {}
+        for path in paths:
+            by_parent.setdefault(path.parent, []).append(path)
+        non_existing = set()
+        self._is_file_cache = is_file = {}
+        for parent, children in by_parent.items():
+            try:
+                with os.scandir(parent) as entries:
+                    # Entries that are neither files nor directories, such as
+                    # broken symlinks, are excluded so that they are validated
+                    # with `Path.exists()` and reported as non-existing.
+                    found = {entry.name: entry.is_file() for entry in entries
+                             if entry.is_file() or entry.is_dir()}
+            except OSError:
+                found = {}
+            for path in children:
+                if path.name in found:
+                    is_file[path] = found[path.name]
+                elif not path.exists():
+                    non_existing.add(path)
+        return [p for p in paths if p in non_existing]
+
+    def _get_base_parsers(self) -> 'dict[str|None, Parser]':
+        # Computed once here to avoid rebuilding the mapping on every `build`.
         parsers = {None: NoInitFileDirectoryParser(), **self.custom_parsers}
         robot_parser = self.standard_parsers['robot']
-        for ext in chain(self.included_extensions,
-                         [p.suffix for p in paths if p.is_file()]):
-            ext = ext.lstrip('.').lower()
+        for ext in self.included_extensions:
+            # Interned keys make lookups with interned `SuiteStructure.extension`
+            # values pointer-equal.
+            ext = sys.intern(ext.lstrip('.').lower())
+            if ext not in parsers:
+                parsers[ext] = self.standard_parsers.get(ext, robot_parser)
+        return parsers
+
+    def _is_file(self, path: Path) -> bool:
+        # Entry type is typically cached by `_get_non_existing` and checking
+        # it does not require an extra `stat` call.
+        if path in self._is_file_cache:
+            return self._is_file_cache[path]
+        return path.is_file()
+
+    def _get_parsers(self, paths: 'tuple[Path]') -> 'dict[str|None, Parser]':
+        suffixes = [p.suffix for p in paths if self._is_file(p)]
+        if not suffixes:
+            return self._base_parsers
+        parsers = dict(self._base_parsers)
+        robot_parser = self.standard_parsers['robot']
+        for ext in suffixes:
+            ext = sys.intern(ext.lstrip('.').lower())
             if ext not in parsers:
                 parsers[ext] = self.standard_parsers.get(ext, robot_parser)
         return parsers
 
     def _validate_not_empty(self, suite: TestSuite, multi_source: bool = False):
-        if multi_source:
-            for child in suite.suites:
-                self._validate_not_empty(child)
-        elif not suite.has_tests:
-            raise DataError(f"Suite '{suite.name}' contains no tests or tasks.")
+        for validated in suite.suites if multi_source else [suite]:
+            if not self._has_tests(validated):
+                raise DataError(f"Suite '{validated.name}' contains no tests "
+                                f"or tasks.")
+
+    def _has_tests(self, suite: TestSuite) -> bool:
+        # Iterative walk with early exit. `TestSuite.has_tests` would recurse
+        # through the whole subtree of each child suite separately.
+        stack = [suite]
+        while stack:
+            suite = stack.pop()
+            if suite.tests:
+                return True
+            stack.extend(suite.suites)
+        return False
 
 
 class SuiteStructureParser(SuiteStructureVisitor):
+    # Shared by suite files that have no inherited defaults. Avoids creating
+    # a new empty TestDefaults for every parsed file.
+    _EMPTY_DEFAULTS = TestDefaults()
 
-    def __init__(self, parsers: 'dict[str, Parser]', rpa: 'bool|None' = None):
+    def __init__(self, parsers: 'dict[str, Parser]', rpa: 'bool|None' = None,
+                 enable_cache: bool = False, workers: int = 1,
+                 lang: LanguagesLike = None, process_curdir: bool = True):
         self.parsers = parsers
         self.rpa = rpa
-        self._rpa_given = rpa is not None
+        # Bound once here to avoid re-checking was the mode given explicitly
+        # for every parsed file.
+        self._validate_execution_mode: 'Callable[[TestSuite], None]' \
+            = self._set_execution_mode if rpa is not None else self._resolve_execution_mode
+        self._enable_cache = enable_cache
+        self._workers = workers
+        self._lang = lang
+        self._process_curdir = process_curdir
+        self._dir_results: 'dict[int, tuple[TestSuite, TestDefaults]]|None' = None
+        self._file_futures: 'dict[int, Future]|None' = None
         self.suite: 'TestSuite|None' = None
-        self._stack: 'list[tuple[TestSuite, TestDefaults]]' = []
+        # Stack entries contain also the bound `suites.append` of the suite to
+        # avoid resolving the whole attribute chain for every added child.
+        self._stack: 'list[tuple[TestSuite, TestDefaults, Callable]]' = []
 
     @property
     def parent_defaults(self) -> 'TestDefaults|None':
-        return self._stack[-1][-1] if self._stack else None
+        return self._stack[-1][1] if self._stack else None
 
     def parse(self, structure: SuiteStructure) -> TestSuite:
-        structure.visit(self)
+        events = list(structure.iter_events())
+        if self._use_workers(events):
+            with ProcessPoolExecutor(max_workers=self._workers) as executor:
+                self._submit_file_tasks(events, executor)
+                self._parse_events(events)
+        else:
+            self._parse_events(events)
         self.suite.rpa = self.rpa
         return self.suite
 
+    def _parse_events(self, events: 'list[tuple[str, SuiteStructure]]'):
+        # Flat iteration is faster than `structure.visit(self)` especially
+        # with big structures.
+        for event, item in events:
+            if event == 'file':
+                self.visit_file(item)
+            elif event == 'start_directory':
+                self.start_directory(item)
+            else:
+                self.end_directory(item)
+
+    def _use_workers(self, events: 'list[tuple[str, SuiteStructure]]') -> bool:
+        if self._workers < 2:
+            return False
+        files = sum(1 for event, item in events
+                    if event == 'file' and self._supports_workers(item))
+        return files > 4
+
+    def _supports_workers(self, structure: SuiteStructure) -> bool:
+        # Only standard parsers can be recreated in worker processes.
+        parser = self.parsers.get(structure.extension)
+        return isinstance(parser, (RobotParser, JsonParser))
+
+    def _submit_file_tasks(self, events: 'list[tuple[str, SuiteStructure]]',
+                           executor: ProcessPoolExecutor):
+        # Pre-pass that parses init files sequentially to get directory
+        # defaults and submits suite file parsing to worker processes.
+        # Results, including possible parsing errors, are consumed in the
+        # normal parsing order by `visit_file` and `start_directory`.
+        self._dir_results = dirs = {}
+        self._file_futures = futures = {}
+        stack: 'list[TestDefaults]' = []
+        for event, structure in events:
+            if event == 'start_directory':
+                parent = stack[-1] if stack else None
+                suite, defaults = self._build_suite_directory(structure, parent)
+                dirs[id(structure)] = (suite, defaults)
+                stack.append(defaults)
+            elif event == 'end_directory':
+                stack.pop()
+            elif self._supports_workers(structure):
+                defaults = stack[-1] if stack else None
+                futures[id(structure)] = executor.submit(
+                    _parse_suite_file_in_process, str(structure.source),
+                    structure.extension, self._lang, self._process_curdir,
+                    defaults
+                )
+
     def visit_file(self, structure: SuiteStructure):
-        LOGGER.info(f"Parsing file '{structure.source}'.")
+        # Callable messages are formatted only if some logger actually
+        # consumes them. Avoids creating a string per parsed file.
+        LOGGER.info(lambda: f"Parsing file '{structure.source}'.")
         suite = self._build_suite_file(structure)
         if self.suite is None:
             self.suite = suite
         else:
-            self._stack[-1][0].suites.append(suite)
+            self._stack[-1][2](suite)
 
     def start_directory(self, structure: SuiteStructure):
         if structure.source:
-            LOGGER.info(f"Parsing directory '{structure.source}'.")
-        suite, defaults = self._build_suite_directory(structure)
+            LOGGER.info(lambda: f"Parsing directory '{structure.source}'.")
+        if self._dir_results is not None:
+            suite, defaults = self._dir_results.pop(id(structure))
+        else:
+            suite, defaults = self._build_suite_directory(structure,
+                                                          self.parent_defaults)
         if self.suite is None:
             self.suite = suite
         else:
-            self._stack[-1][0].suites.append(suite)
-        self._stack.append((suite, defaults))
+            self._stack[-1][2](suite)
+        self._stack.append((suite, defaults, suite.suites.append))
 
     def end_directory(self, structure: SuiteStructure):
-        suite, _ = self._stack.pop()
+        suite = self._stack.pop()[0]
         if suite.rpa is None and suite.suites:
             suite.rpa = suite.suites[0].rpa
 
     def _build_suite_file(self, structure: SuiteStructure):
         source = structure.source
-        defaults = self.parent_defaults or TestDefaults()
+        defaults = self.parent_defaults
         parser = self.parsers[structure.extension]
+        future = self._file_futures.pop(id(structure), None) \
+            if self._file_futures is not None else None
         try:
-            suite = parser.parse_suite_file(source, defaults)
+            if future is not None:
+                suite = self._get_worker_result(future, source, parser, defaults)
+            else:
+                suite = self._parse_suite_file(source, parser, defaults)
             if not suite.tests:
-                LOGGER.info(f"Data source '{source}' has no tests or tasks.")
+                LOGGER.info(lambda: f"Data source '{source}' has no tests or tasks.")
             self._validate_execution_mode(suite)
         except DataError as err:
             raise DataError(f"Parsing '{source}' failed: {err.message}")
         return suite
 
-    def _build_suite_directory(self, structure: SuiteStructure):
+    def _get_worker_result(self, future: Future, source: Path, parser: Parser,
+                           defaults: 'TestDefaults|None') -> TestSuite:
+        try:
+            return future.result()
+        except DataError:
+            raise
+        except Exception:
+            # Worker failed for some other reason than a parsing error, for
+            # example, data was not picklable. Parse in this process instead.
+            return self._parse_suite_file(source, parser, defaults)
+
+    def _parse_suite_file(self, source: Path, parser: Parser,
+                          defaults: 'TestDefaults|None') -> TestSuite:
+        if self._can_use_cache(parser, defaults):
+            try:
+                stat = source.stat()
+            except OSError:
+                pass
+            else:
+                suite = _parse_suite_file_cached(str(source), stat.st_mtime_ns,
+                                                 stat.st_size, parser)
+                return suite.deepcopy()
+        if defaults is None:
+            # Standard parsers only read defaults, so sharing an empty
+            # instance is safe. Custom parsers can also set them, so they
+            # get a fresh instance.
+            defaults = (TestDefaults() if isinstance(parser, CustomParser)
+                        else self._EMPTY_DEFAULTS)
+        return parser.parse_suite_file(source, defaults)
+
+    def _can_use_cache(self, parser: Parser, defaults: 'TestDefaults|None') -> bool:
+        # Caching is safe only when there are no inherited default values and
+        # the parser cannot modify the defaults it gets. Parsing is then a pure
+        # function of the file identified by the cache key.
+        if not self._enable_cache or isinstance(parser, CustomParser):
+            return False
+        return defaults is None or not (defaults.setup or defaults.teardown
+                                        or defaults.tags or defaults.timeout)
+
+    def _build_suite_directory(self, structure: SuiteStructure,
+                               parent_defaults: 'TestDefaults|None'):
         source = structure.init_file or structure.source
-        defaults = TestDefaults(self.parent_defaults)
+        defaults = TestDefaults(parent_defaults)
         parser = self.parsers[structure.extension]
         try:
             suite = parser.parse_init_file(source, defaults)
@@ -236,10 +523,12 @@ class SuiteStructureParser(SuiteStructureVisitor):
             raise DataError(f"Parsing '{source}' failed: {err.message}")
         return suite, defaults
 
-    def _validate_execution_mode(self, suite: TestSuite):
-        if self._rpa_given:
-            suite.rpa = self.rpa
-        elif suite.rpa is None:
+    def _set_execution_mode(self, suite: TestSuite):
+        # Used when the mode was given explicitly with `--rpa` or `--norpa`.
+        suite.rpa = self.rpa
+
+    def _resolve_execution_mode(self, suite: TestSuite):
+        if suite.rpa is None:
             pass
         elif self.rpa is None:
             self.rpa = suite.rpa
@@ -253,23 +542,40 @@ class SuiteStructureParser(SuiteStructureVisitor):
 
 class ResourceFileBuilder:
 
-    def __init__(self, lang: LanguagesLike = None, process_curdir: bool = True):
+    def __init__(self, lang: LanguagesLike = None, process_curdir: bool = True,
+                 enable_cache: bool = False):
         self.lang = lang
         self.process_curdir = process_curdir
+        self.enable_cache = enable_cache
+        self._parsers = _get_standard_parsers(lang, process_curdir)
 
     def build(self, source: Path) -> ResourceFile:
         if not isinstance(source, Path):
             source = Path(source)
-        LOGGER.info(f"Parsing resource file '{source}'.")
-        resource = self._parse(source)
+        LOGGER.info(lambda: f"Parsing resource file '{source}'.")
+        if self.enable_cache:
+            resource = self._parse_with_cache(source)
+        else:
+            resource = self._parse(source)
         if resource.imports or resource.variables or resource.keywords:
-            LOGGER.info(f"Imported resource file '{source}' ({len(resource.keywords)} "
-                        f"keywords).")
+            LOGGER.info(lambda: f"Imported resource file '{source}' "
+                                f"({len(resource.keywords)} keywords).")
         else:
             LOGGER.warn(f"Imported resource file '{source}' is empty.")
         return resource
 
     def _parse(self, source: Path) -> ResourceFile:
-        if source.suffix.lower() in ('.rst', '.rest'):
-            return RestParser(self.lang, self.process_curdir).parse_resource_file(source)
-        return RobotParser(self.lang, self.process_curdir).parse_resource_file(source)
+        # Resource files are imported many times per run. Sharing parser
+        # instances avoids recreating them for every import.
+        extension = 'rest' if source.suffix.lower() in _REST_EXTENSIONS else 'robot'
+        return self._parsers[extension].parse_resource_file(source)
+
+    def _parse_with_cache(self, source: Path) -> ResourceFile:
+        try:
+            stat = source.stat()
+            resource = _parse_resource_file_cached(str(source), stat.st_mtime_ns,
+                                                   stat.st_size, self.lang,
+                                                   self.process_curdir)
+        except (OSError, TypeError):    # TypeError if `lang` is not hashable.
+            return self._parse(source)
+        return resource.deepcopy()
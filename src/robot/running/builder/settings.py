@@ -46,6 +46,11 @@ class TestDefaults:
     files can set them. The easiest way to set defaults to a test is using
     the :meth:`set_to` method.
 
+    Defaults are resolved through the possible :attr:`parent` chain. Values
+    set by parent init files are thus shared, not copied, and wrapping
+    defaults when entering a directory is a constant time operation
+    regardless the directory depth.
+
     This class is part of the `public parser API`__. When implementing ``parse``
     or ``parse_init`` method so that they accept two arguments, the second is
     an instance of this class. If the class is needed as a type hint, it can
@@ -60,7 +60,9 @@ class NormalizedDict(MutableMapping):
         """
         self._data = {}
         self._keys = {}
-        self._normalize = lambda s: normalize(s, ignore, caseless, spaceless)
+        # Storing the spec instead of, for example, a closure keeps instances
+        # picklable.
+        self._normalize_spec = (ignore, caseless, spaceless)
         if initial:
             items = initial.items() if hasattr(initial, 'items') else initial
             for key, value in items:
@@ -70,6 +72,10 @@ class NormalizedDict(MutableMapping):
     def normalized_keys(self):
         return self._keys
 
+    def _normalize(self, string):
+        ignore, caseless, spaceless = self._normalize_spec
+        return normalize(string, ignore, caseless, spaceless)
+
     def __getitem__(self, key):
         return self._data[self._normalize(key)]
 
@@ -109,7 +115,7 @@ class NormalizedDict(MutableMapping):
         copy = NormalizedDict()
         copy._data = self._data.copy()
         copy._keys = self._keys.copy()
-        copy._normalize = self._normalize
+        copy._normalize_spec = self._normalize_spec
         return copy
 
     # Speed-ups. Following methods are faster than default implementations.
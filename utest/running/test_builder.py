@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -116,6 +118,17 @@ class TestBuilding(unittest.TestCase):
         self._validate_rpa(build('../rpa/', rpa=False), False)
         assert_raises(DataError, build, '../rpa')
 
+    def test_dangling_symlink_does_not_exist(self):
+        if os.name == 'nt':
+            self.skipTest('Creating symlinks requires extra privileges on Windows')
+        with tempfile.TemporaryDirectory() as path:
+            link = Path(path, 'dangling.robot')
+            link.symlink_to(Path(path, 'missing.robot'))
+            err = assert_raises(DataError, TestSuiteBuilder().build, link)
+            assert_equal(err.message,
+                         f"Parsing '{link}' failed: File or directory to "
+                         f"execute does not exist.")
+
     def test_custom_parser(self):
         path = DATADIR / '../parsing/custom/CustomParser.py'
         for parser in [path, str(path)]:
@@ -152,6 +165,50 @@ class TestBuilding(unittest.TestCase):
             self._validate_rpa(child, expected)
 
 
+class TestCaching(unittest.TestCase):
+
+    def test_caching_is_disabled_by_default(self):
+        suite1 = build('pass_and_fail.robot')
+        suite2 = build('pass_and_fail.robot')
+        assert_true(suite1 is not suite2)
+        assert_equal(suite1.name, suite2.name)
+
+    def test_cached_suite_is_deep_copied(self):
+        suite1 = build('pass_and_fail.robot', enable_cache=True)
+        suite2 = build('pass_and_fail.robot', enable_cache=True)
+        assert_true(suite1 is not suite2)
+        assert_true(suite1.tests[0] is not suite2.tests[0])
+        assert_equal(suite1.name, suite2.name)
+        assert_equal([t.name for t in suite1.tests],
+                     [t.name for t in suite2.tests])
+        suite1.tests[0].name = 'Modified'
+        assert_equal(suite2.tests[0].name, 'Pass')
+
+    def test_caching_directory_suite(self):
+        suite1 = build('suites', enable_cache=True)
+        suite2 = build('suites', enable_cache=True)
+        assert_equal(suite1.name, suite2.name)
+        assert_equal([s.name for s in suite1.suites],
+                     [s.name for s in suite2.suites])
+
+
+class TestParallelBuilding(unittest.TestCase):
+
+    def test_result_equals_serial_build(self):
+        serial = build('suites')
+        parallel = build('suites', workers=2)
+        self._assert_same_structure(serial, parallel)
+
+    def _assert_same_structure(self, suite1, suite2):
+        assert_equal(suite1.name, suite2.name)
+        assert_equal(suite1.rpa, suite2.rpa)
+        assert_equal([t.name for t in suite1.tests],
+                     [t.name for t in suite2.tests])
+        assert_equal(len(suite1.suites), len(suite2.suites))
+        for child1, child2 in zip(suite1.suites, suite2.suites):
+            self._assert_same_structure(child1, child2)
+
+
 class TestTemplates(unittest.TestCase):
 
     def test_from_setting_table(self):
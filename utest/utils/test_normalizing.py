@@ -175,7 +175,7 @@ class TestNormalizedDict(unittest.TestCase):
         assert_equal(nd, cd)
         assert_equal(nd._data, cd._data)
         assert_equal(nd._keys, cd._keys)
-        assert_equal(nd._normalize, cd._normalize)
+        assert_equal(nd._normalize_spec, cd._normalize_spec)
         nd['C'] = 1
         cd['b'] = 2
         assert_equal(nd._keys, {'a': 'a', 'b': 'B', 'c': 'C'})